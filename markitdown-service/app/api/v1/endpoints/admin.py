@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Security
 from sqlmodel import Session
 from typing import List, Optional
-from app.core.security.api_key import verify_api_key, api_key_header
+from app.core.security.api_key import authenticate_api_key_async, api_key_header, invalidate_key_cache
 from app.models.auth.api_key import Role, APIKey
 from app.models.auth.user import User, UserStatus
 from app.core.security.user import create_user, get_user
@@ -15,16 +15,15 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 # Dependency to verify admin API key
 async def verify_admin_api_key(
-    api_key: str = Security(api_key_header),
-    db: Session = Depends(get_db)
+    api_key: str = Security(api_key_header)
 ) -> APIKey:
     if not api_key:
         raise HTTPException(
             status_code=403,
             detail="API key required"
         )
-    
-    key = verify_api_key(db, api_key)
+
+    key = await authenticate_api_key_async(api_key)
     if not key:
         raise HTTPException(
             status_code=403,
@@ -176,6 +175,7 @@ async def deactivate_user(
         key.is_active = False
     
     db.commit()
+    invalidate_key_cache()
     
     audit_log(
         action=AuditAction.USER_DEACTIVATED,
@@ -319,6 +319,7 @@ async def deactivate_api_key(
     
     api_key.is_active = False
     db.commit()
+    invalidate_key_cache()
     
     audit_log(
         action=AuditAction.API_KEY_DEACTIVATED,
@@ -1,16 +1,26 @@
 from fastapi import APIRouter, UploadFile, File, status, Request, Depends, Response
 from fastapi.responses import PlainTextResponse
+from app.core.responses import ORJSONResponse
 from pydantic import BaseModel, HttpUrl
-from typing import Optional, Dict, Any
-from markitdown import MarkItDown
-import tempfile
-import os
+from typing import List, Optional, Dict, Any
+from io import BytesIO
+from functools import lru_cache, partial
+import asyncio
+import hashlib
 import logging
 import logging.config
-import requests
+import httpx
 import time
-from contextlib import contextmanager
+from urllib.parse import urlsplit
+from app.core import CONVERSION_POOL
 from app.core.security.api_key import get_api_key
+from app.core.cache import (
+    content_cache_key,
+    digest_cache_key,
+    url_cache_key,
+    get_cached_markdown,
+    cache_markdown
+)
 from app.core.config.settings import settings
 from app.core.errors.handlers import handle_api_operation, DEFAULT_ERROR_MAP
 from app.core.errors.exceptions import FileProcessingError, ConversionError, ContentTypeError
@@ -28,6 +38,15 @@ from app.models.auth.api_key import APIKey  # Add this import
 # Initialize router
 router = APIRouter(tags=["conversion"])
 
+# Shared HTTP client with pooled keep-alive connections for URL fetches.
+# Closed on application shutdown (see lifespan in app.main).
+HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=settings.REQUEST_TIMEOUT,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
+
 # Initialize module-specific logger
 logger = logging.getLogger("app.api.conversion")
 perf_logger = logging.getLogger("app.api.conversion.performance")
@@ -51,15 +70,28 @@ async def validate_text_request(request: Request, text_input: TextInput, **kwarg
         }
     )
 
-async def validate_file_request(request: Request, file: UploadFile, **kwargs):
-    """Pre-validator for file conversion"""
-    return await validate_upload_file(file=file)
-
-async def validate_url_request(response: requests.Response, **kwargs):
-    """Validator for URL response"""
+async def validate_url_response_headers(response: httpx.Response) -> None:
+    """Validate a URL response from its headers, before the body downloads."""
     content_type = response.headers.get('content-type', '')
     validate_content_type(content_type)
-    validate_file_size(response.content)
+
+    content_length = int(response.headers.get('content-length', 0))
+    if content_length > settings.MAX_FILE_SIZE:
+        raise FileProcessingError(
+            f"Content size ({content_length} bytes) exceeds maximum limit of "
+            f"{settings.MAX_FILE_SIZE} bytes"
+        )
+
+async def download_url_content(response: httpx.Response) -> bytes:
+    """Stream a response body into memory, enforcing MAX_FILE_SIZE as it arrives."""
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(65536):
+        buf.extend(chunk)
+        if len(buf) > settings.MAX_FILE_SIZE:
+            raise FileProcessingError(
+                f"Content size exceeds maximum limit of {settings.MAX_FILE_SIZE} bytes"
+            )
+    return bytes(buf)
 
 def log_conversion_attempt(
     conversion_type: str,
@@ -67,11 +99,14 @@ def log_conversion_attempt(
     user_id: Optional[str] = None
 ) -> None:
     """Log conversion attempt with metadata."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     log_data = {
         "conversion_type": conversion_type,
         "user_id": user_id,
     }
-    
+
     for key, value in metadata.items():
         if key == 'filename':
             log_data['input_filename'] = value
@@ -79,22 +114,27 @@ def log_conversion_attempt(
             log_data[key] = value
 
     logger.info(
-        f"{conversion_type} conversion initiated",
+        "%s conversion initiated",
+        conversion_type,
         extra=log_data
     )
 
 def log_conversion_result(
     conversion_type: str,
     success: bool,
-    duration: float,
+    duration_ms: float,
     metadata: Dict[str, Any],
     error: Optional[Exception] = None
 ) -> None:
     """Log conversion result with performance metrics."""
+    level = logging.INFO if success else logging.ERROR
+    if not (perf_logger.isEnabledFor(logging.INFO) or logger.isEnabledFor(level)):
+        return
+
     log_data = {
         "conversion_type": conversion_type,
         "success": success,
-        "duration_ms": round(duration * 1000, 2),
+        "duration_ms": round(duration_ms, 2),
     }
 
     for key, value in metadata.items():
@@ -108,49 +148,38 @@ def log_conversion_result(
         log_data["error_type"] = error.__class__.__name__
 
     perf_logger.info(
-        f"{conversion_type} conversion completed",
+        "%s conversion completed",
+        conversion_type,
         extra=log_data
     )
 
     if success:
-        logger.info(f"{conversion_type} conversion successful", extra=log_data)
+        logger.info("%s conversion successful", conversion_type, extra=log_data)
     else:
-        logger.error(f"{conversion_type} conversion failed", extra=log_data)
+        logger.error("%s conversion failed", conversion_type, extra=log_data)
 
-@contextmanager
-def save_temp_file(content: bytes, suffix: str) -> str:
-    """Save content to a temporary file and return the file path."""
-    temp_file_path = None
-    try:
-        with tempfile.NamedTemporaryFile(suffix=suffix, mode='w+b', delete=False) as temp_file:
-            temp_file_path = temp_file.name
-            temp_file.write(content)
-            temp_file.flush()
-            logger.debug(
-                "Temporary file created",
-                extra={
-                    "path": temp_file.name,
-                    "size": len(content)
-                }
-            )
-            yield temp_file.name
-    finally:
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-                logger.debug(f"Temporary file removed: {temp_file_path}")
-            except Exception as e:
-                logger.warning(
-                    "Failed to remove temporary file",
-                    extra={
-                        "path": temp_file_path,
-                        "error": str(e)
-                    }
-                )
-
-def process_conversion(file_path: str, ext: str, url: Optional[str] = None, content_type: str = None) -> str:
-    """Process conversion using MarkItDown and clean the markdown content."""
-    start_time = time.time()
+def _is_wikipedia_url(url: str) -> bool:
+    """Check the URL hostname against wikipedia.org and its subdomains."""
+    host = urlsplit(url).hostname or ""
+    return host == "wikipedia.org" or host.endswith(".wikipedia.org")
+
+@lru_cache(maxsize=1)
+def _get_converter() -> "MarkItDown":
+    """Get the memoized MarkItDown instance (one per process-pool worker).
+
+    markitdown is imported lazily here: it pulls in heavy parser
+    dependencies that workers which never convert shouldn't pay for.
+    """
+    from markitdown import MarkItDown
+    return MarkItDown()
+
+def process_conversion(content: bytes, ext: str, url: Optional[str] = None, content_type: str = None) -> str:
+    """Process conversion using MarkItDown and clean the markdown content.
+
+    The content is passed to MarkItDown as an in-memory stream, avoiding
+    the write/read round-trip through a temporary file.
+    """
+    start_ns = time.perf_counter_ns()
     conversion_metadata = {
         "file_extension": ext,
         "url": url,
@@ -158,32 +187,34 @@ def process_conversion(file_path: str, ext: str, url: Optional[str] = None, cont
     }
 
     try:
-        converter = MarkItDown()
-        
-        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-            raise ConversionError("Input file is empty or does not exist")
-            
-        if url and "wikipedia.org" in url:
+        converter = _get_converter()
+
+        if not content:
+            raise ConversionError("Input content is empty")
+
+        stream = BytesIO(content)
+
+        if url and _is_wikipedia_url(url):
             logger.debug("Using WikipediaConverter for Wikipedia URL")
-            result = converter.convert(file_path, file_extension=ext, url=url, converter_type='wikipedia')
+            result = converter.convert_stream(stream, file_extension=ext, url=url, converter_type='wikipedia')
         else:
             if ext.lower() == '.html':
-                result = converter.convert(file_path, file_extension=ext, converter_type='html')
+                result = converter.convert_stream(stream, file_extension=ext, converter_type='html')
             else:
-                result = converter.convert(file_path, file_extension=ext, url=url)
+                result = converter.convert_stream(stream, file_extension=ext, url=url)
             
         if not result or not result.text_content:
             raise ConversionError("Conversion resulted in empty content")
-        
-        duration = time.time() - start_time
-        log_conversion_result("content", True, duration, conversion_metadata)
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        log_conversion_result("content", True, duration_ms, conversion_metadata)
         return result.text_content
 
     except ConversionError:
         raise
     except Exception as e:
-        duration = time.time() - start_time
-        log_conversion_result("content", False, duration, conversion_metadata, error=e)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        log_conversion_result("content", False, duration_ms, conversion_metadata, error=e)
         logger.exception(
             "Conversion failed",
             extra={
@@ -194,6 +225,50 @@ def process_conversion(file_path: str, ext: str, url: Optional[str] = None, cont
         )
         raise ConversionError(f"Failed to convert content: {str(e)}")
 
+async def run_conversion(
+    content: bytes,
+    ext: str,
+    url: Optional[str] = None,
+    content_type: str = None
+) -> str:
+    """Run process_conversion in the shared process pool.
+
+    Conversion is CPU-bound; dispatching it to worker processes keeps the
+    event loop free to serve concurrent requests.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        CONVERSION_POOL,
+        partial(process_conversion, content, ext, url=url, content_type=content_type)
+    )
+
+async def apply_rate_limit(request: Request, response: Response, path: str) -> None:
+    """Apply the configured rate limit for an endpoint path."""
+    limits = settings.RATE_LIMITS[path]
+    await rate_limit(rate=limits["rate"], per=limits["per"])(request, response)
+
+async def do_conversion(
+    content: bytes,
+    ext: str,
+    cache_key: str,
+    url: Optional[str] = None,
+    content_type: str = None
+) -> str:
+    """Shared conversion body: cache check, pool dispatch, cache store."""
+    cached = await get_cached_markdown(cache_key)
+    if cached is not None:
+        return cached
+
+    markdown_content = await run_conversion(
+        content,
+        ext,
+        url=url,
+        content_type=content_type
+    )
+
+    await cache_markdown(cache_key, markdown_content)
+    return markdown_content
+
 @router.post(
     "/convert/text",
     response_class=PlainTextResponse
@@ -215,11 +290,7 @@ async def convert_text(
     api_key: APIKey = Depends(get_api_key)
 ):
     """Convert text or HTML to markdown."""
-    # Apply rate limiting
-    await rate_limit(
-        rate=settings.RATE_LIMITS["/api/v1/convert/text"]["rate"],
-        per=settings.RATE_LIMITS["/api/v1/convert/text"]["per"]
-    )(request, response)
+    await apply_rate_limit(request, response, "/api/v1/convert/text")
 
     log_conversion_attempt(
         "text",
@@ -229,10 +300,14 @@ async def convert_text(
         },
         str(api_key.id) if api_key else None
     )
-    
-    with save_temp_file(text_input.content.encode('utf-8'), suffix='.html') as temp_file_path:
-        markdown_content = process_conversion(temp_file_path, '.html')
-        return PlainTextResponse(content=markdown_content)
+
+    content = text_input.content.encode('utf-8')
+    markdown_content = await do_conversion(
+        content,
+        '.html',
+        cache_key=content_cache_key(content, '.html')
+    )
+    return PlainTextResponse(content=markdown_content)
 
 @router.post(
     "/convert/file",
@@ -240,7 +315,6 @@ async def convert_text(
 )
 @handle_api_operation(
     "convert_file",
-    pre_validators=[validate_file_request],
     error_map={
         ConversionError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
         RateLimitExceeded: (status.HTTP_429_TOO_MANY_REQUESTS, None),
@@ -254,14 +328,24 @@ async def convert_file(
     api_key: APIKey = Depends(get_api_key)
 ) -> PlainTextResponse:
     """Convert an uploaded file to markdown."""
-    # Apply rate limiting
-    await rate_limit(
-        rate=settings.RATE_LIMITS["/api/v1/convert/file"]["rate"],
-        per=settings.RATE_LIMITS["/api/v1/convert/file"]["per"]
-    )(request, response)
-
-    ext, content = await validate_upload_file(file=file)
-    
+    await apply_rate_limit(request, response, "/api/v1/convert/file")
+
+    markdown_content = await convert_upload(
+        file,
+        str(api_key.id) if api_key else None
+    )
+
+    return PlainTextResponse(
+        content=markdown_content,
+        status_code=status.HTTP_200_OK
+    )
+
+async def convert_upload(file: UploadFile, user_id: Optional[str] = None) -> str:
+    """Validate and convert a single uploaded file, using the cache."""
+    # Hash for the cache key in the same pass as the streamed size check
+    hasher = hashlib.sha256()
+    ext, content = await validate_upload_file(file=file, hasher=hasher)
+
     log_conversion_attempt(
         "file",
         {
@@ -269,21 +353,87 @@ async def convert_file(
             "content_type": file.content_type,
             "extension": ext,
         },
-        str(api_key.id) if api_key else None
+        user_id
+    )
+
+    return await do_conversion(
+        content,
+        ext,
+        cache_key=digest_cache_key(hasher.hexdigest(), ext),
+        content_type=file.content_type
     )
-    
-    with save_temp_file(content, suffix=ext) as temp_file_path:
-        markdown_content = process_conversion(
-            temp_file_path,
-            ext,
-            content_type=file.content_type
+
+@router.post("/convert/files")
+@handle_api_operation(
+    "convert_files",
+    error_map={
+        FileProcessingError: (status.HTTP_400_BAD_REQUEST, None),
+        ConversionError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
+        RateLimitExceeded: (status.HTTP_429_TOO_MANY_REQUESTS, None),
+        **DEFAULT_ERROR_MAP
+    }
+)
+async def convert_files(
+    request: Request,
+    response: Response,
+    files: List[UploadFile] = File(...),
+    api_key: APIKey = Depends(get_api_key)
+) -> ORJSONResponse:
+    """Convert a batch of uploaded files to markdown concurrently.
+
+    Files are dispatched to the conversion pool together, so a batch
+    completes in roughly the time of its slowest member rather than the
+    sum of all of them. Failures are reported per file instead of
+    failing the whole batch.
+    """
+    await apply_rate_limit(request, response, "/api/v1/convert/files")
+
+    if len(files) > settings.MAX_BATCH_FILES:
+        raise FileProcessingError(
+            f"Batch of {len(files)} files exceeds maximum of "
+            f"{settings.MAX_BATCH_FILES} files per request"
         )
-        
-        return PlainTextResponse(
-            content=markdown_content,
-            status_code=status.HTTP_200_OK
+
+    # Sizes come from the multipart parser, so oversized batches are
+    # rejected before any upload body is read into memory
+    total_size = sum(file.size or 0 for file in files)
+    if total_size > settings.MAX_BATCH_SIZE:
+        raise FileProcessingError(
+            f"Batch size ({total_size} bytes) exceeds maximum limit of "
+            f"{settings.MAX_BATCH_SIZE} bytes"
         )
 
+    user_id = str(api_key.id) if api_key else None
+    log_conversion_attempt(
+        "files",
+        {
+            "file_count": len(files),
+        },
+        user_id
+    )
+
+    results = await asyncio.gather(
+        *(convert_upload(file, user_id) for file in files),
+        return_exceptions=True
+    )
+
+    payload = []
+    for file, result in zip(files, results):
+        if isinstance(result, Exception):
+            payload.append({
+                "filename": file.filename,
+                "status": "error",
+                "detail": str(result)
+            })
+        else:
+            payload.append({
+                "filename": file.filename,
+                "status": "success",
+                "markdown": result
+            })
+
+    return ORJSONResponse(content=payload, status_code=status.HTTP_200_OK)
+
 @router.post(
     "/convert/url",
     response_class=PlainTextResponse
@@ -291,9 +441,9 @@ async def convert_file(
 @handle_api_operation(
     "convert_url",
     error_map={
-        requests.ConnectionError: (status.HTTP_502_BAD_GATEWAY, None),
-        requests.Timeout: (status.HTTP_502_BAD_GATEWAY, None),
-        requests.RequestException: (status.HTTP_502_BAD_GATEWAY, None),
+        httpx.ConnectError: (status.HTTP_502_BAD_GATEWAY, None),
+        httpx.TimeoutException: (status.HTTP_502_BAD_GATEWAY, None),
+        httpx.HTTPError: (status.HTTP_502_BAD_GATEWAY, None),
         ContentTypeError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
         ConversionError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
         FileProcessingError: (status.HTTP_400_BAD_REQUEST, None),
@@ -307,11 +457,7 @@ async def convert_url(
     api_key: APIKey = Depends(get_api_key)
 ) -> PlainTextResponse:
     """Fetch a URL and convert its content to markdown."""
-    # Apply rate limiting
-    await rate_limit(
-        rate=settings.RATE_LIMITS["/api/v1/convert/url"]["rate"],
-        per=settings.RATE_LIMITS["/api/v1/convert/url"]["per"]
-    )(request, response)
+    await apply_rate_limit(request, response, "/api/v1/convert/url")
 
     log_conversion_attempt(
         "url",
@@ -322,28 +468,37 @@ async def convert_url(
         str(api_key.id) if api_key else None
     )
 
-    response = requests.get(
+    # Check the cache before fetching so repeat URLs skip the HTTP GET entirely
+    cache_key = url_cache_key(str(url_input.url))
+    cached = await get_cached_markdown(cache_key)
+    if cached is not None:
+        return PlainTextResponse(
+            content=cached,
+            status_code=status.HTTP_200_OK
+        )
+
+    async with HTTP_CLIENT.stream(
+        "GET",
         str(url_input.url),
         headers={
             'User-Agent': settings.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5'
-        },
-        timeout=settings.REQUEST_TIMEOUT,
-        allow_redirects=True
+        }
+    ) as response:
+        response.raise_for_status()
+
+        await validate_url_response_headers(response)
+        content = await download_url_content(response)
+
+    markdown_content = await run_conversion(
+        content,
+        '.html',
+        url=str(url_input.url)
+    )
+    await cache_markdown(cache_key, markdown_content)
+
+    return PlainTextResponse(
+        content=markdown_content,
+        status_code=status.HTTP_200_OK
     )
-    response.raise_for_status()
-    
-    await validate_url_request(response)
-
-    with save_temp_file(response.content, suffix='.html') as temp_file_path:
-        markdown_content = process_conversion(
-            temp_file_path,
-            '.html',
-            url=str(url_input.url)
-        )
-        
-        return PlainTextResponse(
-            content=markdown_content,
-            status_code=status.HTTP_200_OK
-        )
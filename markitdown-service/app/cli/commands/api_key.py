@@ -65,17 +65,20 @@ def list(
     """List all API keys"""
     try:
         with get_db_session() as db:
-            query = select(APIKey)
-            
+            # Join users in the same query to avoid a lookup per key
+            query = select(APIKey, User).join(
+                User, APIKey.user_id == User.id, isouter=True
+            )
+
             if not show_inactive:
                 query = query.where(APIKey.is_active == True)
-                
-            api_keys = db.execute(query).scalars().all()
-            
-            if not api_keys:
+
+            rows = db.execute(query).all()
+
+            if not rows:
                 console.print("[yellow]No API keys found[/yellow]")
                 return
-            
+
             if format.lower() == "json":
                 import json
                 keys_data = [
@@ -87,10 +90,10 @@ def list(
                         "last_used": key.last_used.isoformat() if key.last_used else None,
                         "is_active": key.is_active,
                         "user_id": key.user_id,
-                        "user_name": db.get(User, key.user_id).name if key.user_id else None,
-                        "user_status": db.get(User, key.user_id).status.value if key.user_id else None
+                        "user_name": user.name if user else None,
+                        "user_status": user.status.value if user else None
                     }
-                    for key in api_keys
+                    for key, user in rows
                 ]
                 console.print_json(json.dumps(keys_data, indent=2))
                 return
@@ -109,9 +112,7 @@ def list(
             table.add_column("Last Used", style="magenta")
             table.add_column("Key Status", style="red")
             
-            for key in api_keys:
-                # Get user information
-                user = db.get(User, key.user_id) if key.user_id else None
+            for key, user in rows:
                 user_display = f"{user.name} (ID: {user.id})" if user else "[red]No owner[/red]"
                 user_status = "🟢 Active" if user and user.status == UserStatus.ACTIVE else "🔴 Inactive" if user else "N/A"
                 
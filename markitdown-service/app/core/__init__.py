@@ -1,8 +1,13 @@
+from concurrent.futures import ProcessPoolExecutor
 from app.core.config.settings import settings
 from app.core.errors.base import OperationError
 from app.core.errors.exceptions import FileProcessingError, ConversionError, ContentTypeError
 from app.core.errors.handlers import handle_api_operation, DEFAULT_ERROR_MAP
 
+# Shared pool for CPU-bound conversion work. Worker processes are spawned
+# lazily on first submit, so CLI imports don't pay for the pool.
+CONVERSION_POOL = ProcessPoolExecutor(max_workers=settings.CONVERSION_WORKERS)
+
 __all__ = [
     "settings",
     "OperationError",
@@ -10,5 +15,6 @@ __all__ = [
     "ConversionError",
     "ContentTypeError",
     "handle_api_operation",
-    "DEFAULT_ERROR_MAP"
+    "DEFAULT_ERROR_MAP",
+    "CONVERSION_POOL"
 ]
\ No newline at end of file
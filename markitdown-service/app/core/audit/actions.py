@@ -23,6 +23,7 @@ class AuditAction(str, Enum):
     # Conversion Actions
     CONVERT_TEXT = "convert_text"
     CONVERT_FILE = "convert_file"
+    CONVERT_FILES = "convert_files"
     CONVERT_URL = "convert_url"
     
     # Rate Limiting Actions
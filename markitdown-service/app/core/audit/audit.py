@@ -1,8 +1,10 @@
+import atexit
 import logging
+import queue
 from datetime import datetime, UTC
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Callable, Dict, Union
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from app.core.config.settings import settings
 from app.core.logging.formatters import AuditFormatter
 
@@ -13,6 +15,23 @@ Path(settings.LOG_DIR).mkdir(exist_ok=True)
 audit_logger = logging.getLogger("audit")
 audit_logger.setLevel(logging.INFO)  # Audit logs should always be at INFO level
 
+class _AuditQueueHandler(QueueHandler):
+    """Queue handler that keeps the structured msg dict intact and drops
+    (with a warning) rather than blocking when the queue is full."""
+
+    def prepare(self, record):
+        # The default prepare() pre-formats record.msg into a string,
+        # which would break AuditFormatter's dict handling
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            logging.getLogger("app.utils.audit").warning(
+                "Audit queue full, dropping audit record"
+            )
+
 if settings.AUDIT_LOG_ENABLED and not audit_logger.handlers:
     # Create audit log handler with rotation
     audit_handler = TimedRotatingFileHandler(
@@ -22,11 +41,23 @@ if settings.AUDIT_LOG_ENABLED and not audit_logger.handlers:
         backupCount=settings.AUDIT_LOG_RETENTION_DAYS,
         encoding=settings.LOG_ENCODING
     )
-    
+
     # Use the centralized AuditFormatter
     formatter = AuditFormatter()
     audit_handler.setFormatter(formatter)
-    audit_logger.addHandler(audit_handler)
+
+    # Decouple audit file I/O from the request path: records are queued
+    # by callers and written by a single background listener thread
+    _audit_queue: queue.Queue = queue.Queue(maxsize=10_000)
+    _audit_listener = QueueListener(
+        _audit_queue,
+        audit_handler,
+        respect_handler_level=True
+    )
+    _audit_listener.start()
+    atexit.register(_audit_listener.stop)
+
+    audit_logger.addHandler(_AuditQueueHandler(_audit_queue))
 
     # Prevent audit logs from propagating to root logger
     audit_logger.propagate = False
@@ -34,17 +65,20 @@ if settings.AUDIT_LOG_ENABLED and not audit_logger.handlers:
 def audit_log(
     action: str,
     user_id: Optional[str],
-    details: Union[str, Dict[str, Any]],
+    details: Union[str, Dict[str, Any], Callable[[], Union[str, Dict[str, Any]]]],
     status: str = "success",
     **extra: Any
 ) -> None:
     """
     Log an audit event with enhanced context and formatting.
-    
+
     Args:
         action: The action being audited
         user_id: The ID of the user performing the action (if applicable)
-        details: Additional details about the action (string or dict)
+        details: Additional details about the action (string, dict, or a
+            zero-argument callable returning either — callables are only
+            invoked when audit logging is enabled, so hot paths can defer
+            building the details dict)
         status: The status of the action ("success" or "failure")
         **extra: Additional key-value pairs to include in the audit log
     """
@@ -52,6 +86,9 @@ def audit_log(
         return
 
     try:
+        if callable(details):
+            details = details()
+
         # Create the audit log entry
         audit_entry = {
             "action": action,
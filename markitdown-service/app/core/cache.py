@@ -0,0 +1,85 @@
+# app/core/cache.py
+import hashlib
+import logging
+from typing import Optional
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Lazily created Redis client shared across requests
+_redis_client = None
+
+def get_redis():
+    """Get the shared async Redis client, creating it on first use."""
+    global _redis_client
+    if _redis_client is None:
+        from redis import asyncio as aioredis
+        _redis_client = aioredis.from_url(settings.REDIS_URL)
+        logger.info("Redis cache client initialized", extra={"url": settings.REDIS_URL})
+    return _redis_client
+
+def digest_cache_key(digest_hex: str, ext: str) -> str:
+    """Build a cache key from an already-computed SHA-256 hex digest."""
+    return f"{digest_hex}:{ext.lower()}"
+
+def content_cache_key(content: bytes, ext: str) -> str:
+    """Build a cache key from content bytes and file extension."""
+    return digest_cache_key(hashlib.sha256(content).hexdigest(), ext)
+
+def url_cache_key(url: str) -> str:
+    """Build a cache key for a URL conversion."""
+    return f"url:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+async def get_cached_markdown(key: str) -> Optional[str]:
+    """
+    Return cached markdown for a key, or None on miss.
+
+    Cache failures are logged and treated as misses so a Redis outage
+    never breaks conversions.
+    """
+    if not settings.ENABLE_CACHE:
+        return None
+
+    try:
+        cached = await get_redis().get(key)
+        if cached is not None:
+            logger.debug("Cache hit", extra={"cache_key": key})
+            return cached.decode('utf-8')
+        logger.debug("Cache miss", extra={"cache_key": key})
+        return None
+    except Exception as e:
+        logger.warning(
+            "Cache lookup failed",
+            extra={"cache_key": key, "error": str(e)}
+        )
+        return None
+
+async def cache_markdown(key: str, markdown_content: str) -> None:
+    """Store converted markdown under a key with the configured TTL."""
+    if not settings.ENABLE_CACHE:
+        return
+
+    try:
+        await get_redis().setex(
+            key,
+            settings.CACHE_TTL,
+            markdown_content.encode('utf-8')
+        )
+        logger.debug(
+            "Cached conversion result",
+            extra={"cache_key": key, "ttl": settings.CACHE_TTL}
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to cache conversion result",
+            extra={"cache_key": key, "error": str(e)}
+        )
+
+__all__ = [
+    "get_redis",
+    "digest_cache_key",
+    "content_cache_key",
+    "url_cache_key",
+    "get_cached_markdown",
+    "cache_markdown"
+]
@@ -1,8 +1,9 @@
 from pydantic_settings import BaseSettings
-from pydantic import ConfigDict, EmailStr
+from pydantic import ConfigDict, EmailStr, model_validator
 from typing import List, Optional, Dict, Any
-import os
-from functools import lru_cache
+import fnmatch
+import re
+from functools import cached_property, lru_cache
 import logging
 
 class LoggingConfig:
@@ -23,6 +24,23 @@ class LoggingConfig:
         "NOTSET": NOTSET,
     }
 
+# Default log level per environment, used when LOG_LEVEL is unset.
+# Module-level so log-level lookups don't rebuild the dict on every call.
+_ENV_DEFAULT_LEVELS = {
+    "development": "DEBUG",
+    "test": "WARNING",
+    "production": "INFO"
+}
+
+# SECRET_KEY values shipped in example configs and compose files. The key
+# signs the HMAC under which API keys are stored, so running with a known
+# placeholder leaves every stored credential forgeable; startup refuses
+# them in production and warns elsewhere (see lifespan in app.main).
+PLACEHOLDER_SECRET_KEYS = frozenset({
+    "your-secret-key-here",
+    "default-secret-key-change-in-production",
+})
+
 class Settings(BaseSettings):
     # Pydantic V2 configuration
     model_config = ConfigDict(
@@ -31,8 +49,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8"
     )
 
-    # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    # Environment (read from env by pydantic-settings)
+    ENVIRONMENT: str = "development"
     
     # API Settings
     API_V1_STR: str = "/api/v1"
@@ -41,11 +59,21 @@ class Settings(BaseSettings):
     
     # File Processing Settings
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB default
+    MAX_BATCH_FILES: int = 20
+    MAX_BATCH_SIZE: int = 50 * 1024 * 1024  # 50MB aggregate per batch
     SUPPORTED_EXTENSIONS: List[str] = [
         '.pdf', '.docx', '.pptx', '.xlsx', '.wav', '.mp3',
         '.jpg', '.jpeg', '.png', '.html', '.htm', '.txt', '.csv', '.json', '.xml'
     ]
     
+    # Result Cache Settings
+    ENABLE_CACHE: bool = False
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL: int = 3600  # seconds
+
+    # Conversion Settings
+    CONVERSION_WORKERS: int = 2  # process pool size for CPU-bound conversions
+
     # Request Settings
     REQUEST_TIMEOUT: int = 10  # seconds
     USER_AGENT: str = (
@@ -66,6 +94,7 @@ class Settings(BaseSettings):
     # Endpoint-specific rate limits
     RATE_LIMITS: Dict[str, Dict[str, int]] = {
         "/api/v1/convert/url": {"rate": 60, "per": 60},
+        "/api/v1/convert/files": {"rate": 30, "per": 60},
         "/api/v1/convert/file": {"rate": 60, "per": 60},
         "/api/v1/convert/text": {"rate": 60, "per": 60}
     }
@@ -80,35 +109,29 @@ class Settings(BaseSettings):
     ALLOWED_METHODS: List[str] = ["*"]
     ALLOWED_HEADERS: List[str] = ["*"]
 
-    # Database Settings
-    DATABASE_URL: str = os.getenv(
-        "DATABASE_URL",
-        f"sqlite:///./{ENVIRONMENT}_api_keys.db"
-    )
+    # Database Settings (URL and echo derive from ENVIRONMENT when unset)
+    DATABASE_URL: Optional[str] = None
     DATABASE_CONNECT_ARGS: dict = {"check_same_thread": False}
     DATABASE_POOL_SIZE: int = 5
     DATABASE_POOL_RECYCLE: int = 3600
-    DATABASE_ECHO: bool = ENVIRONMENT == "development"
+    DATABASE_ECHO: Optional[bool] = None
 
     # API Key Authentication Settings
     API_KEY_AUTH_ENABLED: bool = True
     API_KEY_HEADER_NAME: str = "X-API-Key"
     API_KEY_LENGTH: int = 32
-    ADMIN_API_KEY: Optional[str] = os.getenv("ADMIN_API_KEY")
+    ADMIN_API_KEY: Optional[str] = None
     API_KEY_EXPIRATION_DAYS: Optional[int] = None
 
     # Initial Setup Settings
-    INITIAL_ADMIN_NAME: str = os.getenv("INITIAL_ADMIN_NAME", "System Admin")
-    INITIAL_ADMIN_EMAIL: str = os.getenv(
-        "INITIAL_ADMIN_EMAIL", 
-        "admin@example.com"
-    )
+    INITIAL_ADMIN_NAME: str = "System Admin"
+    INITIAL_ADMIN_EMAIL: str = "admin@example.com"
 
     # Security Settings
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
+    SECRET_KEY: str = "your-secret-key-here"
 
     # Enhanced Logging Settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     LOG_DIR: str = "logs"
@@ -157,46 +180,100 @@ class Settings(BaseSettings):
 
     # Audit Log Settings
     AUDIT_LOG_ENABLED: bool = True
-    AUDIT_LOG_FILE: str = f"logs/audit_{ENVIRONMENT}.log"
+    AUDIT_LOG_FILE: Optional[str] = None
     AUDIT_LOG_RETENTION_DAYS: int = 90
     AUDIT_LOG_LEVEL: str = "INFO"  # Audit logs should typically stay at INFO
 
-    # API Documentation Settings
-    DOCS_URL: Optional[str] = "/docs" if ENVIRONMENT != "production" else None
-    REDOC_URL: Optional[str] = "/redoc" if ENVIRONMENT != "production" else None
-    OPENAPI_URL: Optional[str] = "/openapi.json" if ENVIRONMENT != "production" else None
+    # API Documentation Settings (disabled in production unless overridden)
+    DOCS_URL: Optional[str] = None
+    REDOC_URL: Optional[str] = None
+    OPENAPI_URL: Optional[str] = None
 
     # CLI Tool Settings
     CLI_COLORS: bool = True
     CLI_TABLE_STYLE: str = "rounded"
 
-    @property
+    @model_validator(mode="after")
+    def _derive_environment_defaults(self) -> "Settings":
+        """Fill in fields whose defaults depend on the resolved ENVIRONMENT.
+
+        These used to be computed from a class-body os.getenv snapshot,
+        which re-read the environment and ignored any ENVIRONMENT value
+        supplied via .env or instance overrides.
+        """
+        if self.DATABASE_URL is None:
+            self.DATABASE_URL = f"sqlite:///./{self.ENVIRONMENT}_api_keys.db"
+        if self.DATABASE_ECHO is None:
+            self.DATABASE_ECHO = self.ENVIRONMENT == "development"
+        if self.AUDIT_LOG_FILE is None:
+            self.AUDIT_LOG_FILE = f"logs/audit_{self.ENVIRONMENT}.log"
+        if self.ENVIRONMENT != "production":
+            if self.DOCS_URL is None:
+                self.DOCS_URL = "/docs"
+            if self.REDOC_URL is None:
+                self.REDOC_URL = "/redoc"
+            if self.OPENAPI_URL is None:
+                self.OPENAPI_URL = "/openapi.json"
+        return self
+
+    @cached_property
+    def RATE_LIMIT_EXCLUDED_REGEX(self) -> "re.Pattern":
+        """Excluded-endpoint globs compiled into one anchored regex.
+
+        Built once so the per-request exclusion check is a single match
+        instead of iterating and normalizing the glob list each time.
+        """
+        return re.compile(
+            "|".join(fnmatch.translate(pattern)
+                     for pattern in self.RATE_LIMIT_EXCLUDED_ENDPOINTS)
+        )
+
+    @cached_property
+    def SUPPORTED_EXTENSIONS_SET(self) -> frozenset:
+        """Lowercased supported extensions, normalized once for O(1) membership checks."""
+        return frozenset(ext.lower() for ext in self.SUPPORTED_EXTENSIONS)
+
+    @cached_property
     def get_log_level(self) -> int:
-        """Get the numeric log level, with environment-specific defaults"""
-        env_levels = {
-            "development": "DEBUG",
-            "test": "WARNING",
-            "production": "INFO"
-        }
-        
+        """Get the numeric log level, with environment-specific defaults.
+
+        Cached: LOG_LEVEL and ENVIRONMENT are fixed for the process
+        lifetime, so the string ops and dict lookups run once.
+        """
         # Use LOG_LEVEL from env, fall back to environment-specific default
-        level_name = self.LOG_LEVEL.upper() or env_levels.get(self.ENVIRONMENT, "INFO")
+        level_name = self.LOG_LEVEL.upper() or _ENV_DEFAULT_LEVELS.get(self.ENVIRONMENT, "INFO")
         return LoggingConfig.LEVEL_MAP.get(level_name, LoggingConfig.INFO)
 
+    @cached_property
+    def _component_levels(self) -> Dict[str, int]:
+        """COMPONENT_LOG_LEVELS resolved to numeric levels, computed once."""
+        default_level = self.get_log_level
+        return {
+            component: LoggingConfig.LEVEL_MAP.get(name.upper(), default_level)
+            for component, name in self.COMPONENT_LOG_LEVELS.items()
+        }
+
+    @cached_property
+    def _retention_days(self) -> Dict[str, int]:
+        """LOG_RETENTION_DAYS with the environment multiplier applied, computed once."""
+        multiplier = self.LOG_RETENTION_MULTIPLIERS.get(self.ENVIRONMENT, 1.0)
+        return {
+            log_type: int(days * multiplier)
+            for log_type, days in self.LOG_RETENTION_DAYS.items()
+        }
+
+    @cached_property
+    def _default_retention_days(self) -> int:
+        """Adjusted retention for log types without an explicit entry."""
+        return int(30 * self.LOG_RETENTION_MULTIPLIERS.get(self.ENVIRONMENT, 1.0))
+
     def get_retention_days(self, log_type: str) -> int:
         """Get environment-adjusted retention period for log type"""
-        base_days = self.LOG_RETENTION_DAYS.get(log_type, 30)
-        multiplier = self.LOG_RETENTION_MULTIPLIERS.get(self.ENVIRONMENT, 1.0)
-        return int(base_days * multiplier)
+        return self._retention_days.get(log_type, self._default_retention_days)
 
     def get_component_log_level(self, component: str) -> int:
         """Get log level for specific component"""
-        if component in self.COMPONENT_LOG_LEVELS:
-            return LoggingConfig.LEVEL_MAP.get(
-                self.COMPONENT_LOG_LEVELS[component].upper(),
-                self.get_log_level
-            )
-        return self.get_log_level
+        return self._component_levels.get(component, self.get_log_level)
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -2,6 +2,7 @@
 from functools import wraps
 from typing import Callable, Type, Optional, Dict, Tuple, List
 from fastapi import HTTPException, status, Request
+import httpx
 import requests
 import logging
 from app.core.audit import audit_log, AuditAction
@@ -21,6 +22,9 @@ DEFAULT_ERROR_MAP = {
     requests.ConnectionError: (status.HTTP_502_BAD_GATEWAY, None),
     requests.Timeout: (status.HTTP_502_BAD_GATEWAY, None),
     requests.RequestException: (status.HTTP_502_BAD_GATEWAY, None),
+    httpx.ConnectError: (status.HTTP_502_BAD_GATEWAY, None),
+    httpx.TimeoutException: (status.HTTP_502_BAD_GATEWAY, None),
+    httpx.HTTPError: (status.HTTP_502_BAD_GATEWAY, None),
     ConversionError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
     OperationError: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
     RateLimitExceeded: (status.HTTP_429_TOO_MANY_REQUESTS, None),
@@ -32,6 +36,7 @@ DEFAULT_ERROR_MAP = {
 OPERATION_TO_AUDIT_ACTION = {
     "convert_text": AuditAction.CONVERT_TEXT,
     "convert_file": AuditAction.CONVERT_FILE,
+    "convert_files": AuditAction.CONVERT_FILES,
     "convert_url": AuditAction.CONVERT_URL,
 }
 
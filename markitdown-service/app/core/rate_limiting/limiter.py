@@ -3,6 +3,7 @@ from typing import Optional, Tuple, Dict, Any, Callable
 from fastapi import Request, Response
 import time
 from collections import defaultdict
+from functools import lru_cache
 import threading
 from app.core.config import settings
 from app.core.audit import audit_log, AuditAction
@@ -32,21 +33,21 @@ class RateLimiter:
         return f"ip_{request.client.host}"
 
     def check_rate_limit(
-        self, 
+        self,
         request: Request,
-        response: Response,
+        response: Optional[Response] = None,
         rate: int = 30,
         per: int = 60
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if request should be rate limited.
-        
+
         Args:
             request: FastAPI request
-            response: FastAPI response
+            response: FastAPI response (unused, kept for call compatibility)
             rate: Number of allowed requests
             per: Time period in seconds
-            
+
         Returns:
             Tuple[bool, Dict[str, Any]]: (is_allowed, limit_info)
         """
@@ -84,17 +85,18 @@ class RateLimiter:
                 "retry_after": time_left
             }
             
-            # Log rate limit check
-            logger.debug(
-                f"Rate limit check: {bucket_key}",
-                extra={
-                    "allowed": is_allowed,
-                    "remaining": remaining,
-                    "reset": reset_time,
-                    "path": request.url.path
-                }
-            )
-            
+            # Log rate limit check (gated: runs once per request)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Rate limit check: %s", bucket_key,
+                    extra={
+                        "allowed": is_allowed,
+                        "remaining": remaining,
+                        "reset": reset_time,
+                        "path": request.url.path
+                    }
+                )
+
             return is_allowed, limit_info
 
 class RateLimitExceeded(Exception):
@@ -106,16 +108,26 @@ class RateLimitExceeded(Exception):
 # Global rate limiter instance
 limiter = RateLimiter()
 
+@lru_cache(maxsize=None)
+def _static_limit_headers(limit: int) -> Dict[str, str]:
+    """Precomputed header values that only depend on the configured limit."""
+    limit_str = str(limit)
+    return {
+        "X-RateLimit-Limit": limit_str,
+        "RateLimit-Policy": f"{limit_str};w={60}",
+        "RateLimit-Limit": limit_str,
+    }
+
 def add_rate_limit_headers(response: Response, limit_info: Dict[str, Any]) -> None:
     """Add standard rate limit headers to response"""
+    remaining = str(limit_info["remaining"])
+    reset = str(limit_info["reset"])
     response.headers.update({
-        "X-RateLimit-Limit": str(limit_info["limit"]),
-        "X-RateLimit-Remaining": str(limit_info["remaining"]),
-        "X-RateLimit-Reset": str(limit_info["reset"]),
-        "RateLimit-Policy": f"{limit_info['limit']};w={60}",
-        "RateLimit-Limit": str(limit_info["limit"]),
-        "RateLimit-Remaining": str(limit_info["remaining"]),
-        "RateLimit-Reset": str(limit_info["reset"]),
+        **_static_limit_headers(limit_info["limit"]),
+        "X-RateLimit-Remaining": remaining,
+        "X-RateLimit-Reset": reset,
+        "RateLimit-Remaining": remaining,
+        "RateLimit-Reset": reset,
         "Retry-After": str(limit_info["retry_after"])
     })
 
@@ -132,13 +144,16 @@ def rate_limit(
             # Skip rate limiting if disabled
             if not settings.RATE_LIMITING_ENABLED:
                 return
-                
+
+            # Extract once; reused below in checks, logging and audit
+            path = request.url.path
+
             # Skip if endpoint is in the excluded list
-            if any(request.url.path.startswith(excluded) for excluded in settings.RATE_LIMIT_EXCLUDED_ENDPOINTS):
+            if settings.RATE_LIMIT_EXCLUDED_REGEX.match(path):
                 return
 
             # Skip if endpoint not in limited set
-            if endpoints and request.url.path not in endpoints:
+            if endpoints and path not in endpoints:
                 return
                 
             is_allowed, limit_info = limiter.check_rate_limit(
@@ -157,20 +172,20 @@ def rate_limit(
                     "Rate limit exceeded",
                     extra={
                         "bucket_key": limit_info["key"],
-                        "path": request.url.path,
+                        "path": path,
                         "method": request.method,
                         "limit": limit_info["limit"],
                         "reset": limit_info["reset"]
                     }
                 )
-                
+
                 # Audit log rate limit exceeded
                 try:
                     audit_log(
                         action=AuditAction.RATE_LIMIT_EXCEEDED,  # Use enum value
                         user_id=getattr(request.state, "api_key", {}).get("id"),
                         details={
-                            "path": request.url.path,
+                            "path": path,
                             "method": request.method,
                             "limit_info": limit_info
                         }
@@ -2,14 +2,21 @@
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
-from app.core.rate_limiting.limiter import RateLimitExceeded, limiter, rate_limit
-from fastapi.responses import JSONResponse
+from app.core.rate_limiting.limiter import RateLimitExceeded, limiter, rate_limit, _static_limit_headers
+import json
 import time
 import logging
 from app.core.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# The 429 payload never varies (retry timing travels in the Retry-After
+# header), so serialize it once instead of per rejected request
+_RATE_LIMITED_BODY = json.dumps({
+    "detail": "Rate limit exceeded",
+    "type": "rate_limit_exceeded"
+}).encode("utf-8")
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp):
         super().__init__(app)
@@ -21,7 +28,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         path = request.url.path
         
         # Check if the path is excluded from rate limiting
-        if any(path.startswith(excluded) for excluded in settings.RATE_LIMIT_EXCLUDED_ENDPOINTS):
+        if settings.RATE_LIMIT_EXCLUDED_REGEX.match(path):
             return await call_next(request)
 
         # Get endpoint-specific limits from settings
@@ -34,24 +41,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         )
 
         # Apply rate limiting
-        response = Response()
         is_allowed, limit_info = limiter.check_rate_limit(
             request,
-            response,
             rate=rate_limits["rate"],
             per=rate_limits["per"]
         )
 
         # If rate limit is exceeded, return 429 response
         if not is_allowed:
-            return JSONResponse(
+            return Response(
+                content=_RATE_LIMITED_BODY,
                 status_code=429,
-                content={
-                    "detail": "Rate limit exceeded",
-                    "retry_after": limit_info["retry_after"]
-                },
+                media_type="application/json",
                 headers={
-                    "X-RateLimit-Limit": str(limit_info["limit"]),
+                    **_static_limit_headers(limit_info["limit"]),
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Reset": str(limit_info["reset"]),
                     "Retry-After": str(limit_info["retry_after"])
@@ -1,15 +1,21 @@
 from datetime import datetime, UTC
+import asyncio
+import hashlib
+import hmac
 import secrets
+import threading
+import time
 import bcrypt
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 from fastapi import Security, HTTPException, Depends, Request
 from fastapi.security.api_key import APIKeyHeader
-from starlette.status import HTTP_403_FORBIDDEN
+from starlette.status import HTTP_403_FORBIDDEN, HTTP_500_INTERNAL_SERVER_ERROR
 from sqlmodel import Session, select
 from app.models.auth.api_key import APIKey, Role
 from app.models.auth.user import User, UserStatus
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_db_session, get_db_session_ro
 import logging
 from app.core.audit import audit_log, AuditAction
 
@@ -18,28 +24,158 @@ logger = logging.getLogger(__name__)
 # Initialize API key header
 api_key_header = APIKeyHeader(name=settings.API_KEY_HEADER_NAME, auto_error=False)
 
+# Length of the indexed public prefix used to locate a key row without
+# running bcrypt against every active key
+KEY_PREFIX_LENGTH = 8
+
+# In-process cache of recently verified keys, keyed by SHA-256 of the
+# presented key. A hit skips both the SELECT and the bcrypt comparison,
+# so repeat requests from the same client authenticate in microseconds.
+# Entries expire after the TTL and the cache is cleared whenever a key
+# or user is deactivated, so a revoked key is honoured within one window.
+KEY_CACHE_TTL = 60  # seconds
+KEY_CACHE_MAX_ENTRIES = 1024
+_key_cache: "OrderedDict[bytes, Tuple[APIKey, float]]" = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+def _key_cache_get(digest: bytes) -> Optional[APIKey]:
+    """Return the cached APIKey for a digest, or None if absent/expired."""
+    with _key_cache_lock:
+        entry = _key_cache.get(digest)
+        if entry is None:
+            return None
+        api_key, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del _key_cache[digest]
+            return None
+        _key_cache.move_to_end(digest)
+        return api_key
+
+def _key_cache_put(digest: bytes, api_key: APIKey) -> APIKey:
+    """Cache a verified key as a detached copy, evicting LRU entries."""
+    cached = APIKey(
+        id=api_key.id,
+        key="",  # never cache the hash
+        key_prefix=api_key.key_prefix,
+        name=api_key.name,
+        role=api_key.role,
+        created_at=api_key.created_at,
+        last_used=api_key.last_used,
+        is_active=api_key.is_active,
+        user_id=api_key.user_id
+    )
+    with _key_cache_lock:
+        _key_cache[digest] = (cached, time.monotonic() + KEY_CACHE_TTL)
+        _key_cache.move_to_end(digest)
+        while len(_key_cache) > KEY_CACHE_MAX_ENTRIES:
+            _key_cache.popitem(last=False)
+    return cached
+
+def invalidate_key_cache() -> None:
+    """Drop all cached verifications.
+
+    Called after any key or user deactivation; revocation is rare enough
+    that clearing the whole cache is simpler than reverse-mapping key IDs
+    to digests.
+    """
+    with _key_cache_lock:
+        _key_cache.clear()
+
+# Buffer of pending last_used updates, flushed periodically instead of
+# committing (and on SQLite, fsyncing) once per authenticated request.
+LAST_USED_FLUSH_INTERVAL = 30  # seconds
+_last_used_buffer: dict = {}
+_last_used_lock = threading.Lock()
+
+def record_key_usage(key_id: int) -> None:
+    """Note that a key was used; the timestamp is written on the next flush."""
+    with _last_used_lock:
+        _last_used_buffer[key_id] = datetime.now(UTC)
+
+def flush_last_used() -> None:
+    """Write all buffered last_used timestamps in a single transaction."""
+    with _last_used_lock:
+        if not _last_used_buffer:
+            return
+        pending = dict(_last_used_buffer)
+        _last_used_buffer.clear()
+    try:
+        with get_db_session() as db:
+            for key_id, used_at in pending.items():
+                api_key = db.get(APIKey, key_id)
+                if api_key:
+                    api_key.last_used = used_at
+    except Exception:
+        logger.exception("Failed to flush last_used updates")
+
+async def flush_last_used_loop() -> None:
+    """Background task flushing last_used writes every flush interval."""
+    while True:
+        await asyncio.sleep(LAST_USED_FLUSH_INTERVAL)
+        await asyncio.to_thread(flush_last_used)
+
 def generate_api_key() -> str:
     """Generate a secure API key."""
     return secrets.token_urlsafe(settings.API_KEY_LENGTH)
 
 def hash_api_key(key: str) -> str:
-    """Hash an API key for storage."""
-    key_bytes = key.encode('utf-8')
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(key_bytes, salt).decode('utf-8')
+    """Hash an API key for storage.
+
+    Keys are 32 bytes of CSPRNG output, so a fast keyed HMAC is
+    sufficient — bcrypt's deliberate slowness only buys protection for
+    low-entropy secrets like passwords. HMAC output is deterministic,
+    which also lets lookup hit the key index directly.
+
+    Because SECRET_KEY is the HMAC key, rotating it silently invalidates
+    every stored API key — verification simply fails with 403 — so a
+    rotation has to be paired with re-issuing keys to clients.
+    """
+    return hmac.new(
+        settings.SECRET_KEY.encode('utf-8'),
+        key.encode('utf-8'),
+        'sha256'
+    ).hexdigest()
 
 def verify_key_hash(key: str, hashed_key: str) -> bool:
-    """Verify an API key against its hash."""
-    key_bytes = key.encode('utf-8')
-    hashed_key_bytes = hashed_key.encode('utf-8')
-    return bcrypt.checkpw(key_bytes, hashed_key_bytes)
+    """Verify an API key against its stored hash (HMAC or legacy bcrypt)."""
+    if hashed_key.startswith("$2"):
+        # Row created before the switch to HMAC storage
+        return bcrypt.checkpw(key.encode('utf-8'), hashed_key.encode('utf-8'))
+    return hmac.compare_digest(hash_api_key(key), hashed_key)
 
 def lookup_api_key(db: Session, key: str) -> Optional[APIKey]:
-    """Look up an API key without verifying it."""
-    stmt = select(APIKey).where(APIKey.is_active == True)
-    api_keys = db.execute(stmt).scalars().all()
-    for api_key in api_keys:
-        if verify_key_hash(key, api_key.key):
+    """Look up an API key without verifying it.
+
+    HMAC-stored keys resolve with a single indexed SELECT on the key
+    column. Legacy bcrypt rows can't be matched that way (their hashes
+    are salted), so they fall back to a prefix-narrowed bcrypt check and
+    are transparently rehashed to HMAC on first successful use.
+    """
+    stmt = select(APIKey).where(
+        APIKey.key == hash_api_key(key),
+        APIKey.is_active == True
+    )
+    api_key = db.execute(stmt).scalars().first()
+    if api_key:
+        return api_key
+
+    # Legacy bcrypt rows: narrow by prefix where present, then verify
+    stmt = select(APIKey).where(
+        APIKey.key_prefix == key[:KEY_PREFIX_LENGTH],
+        APIKey.is_active == True
+    )
+    candidates = list(db.execute(stmt).scalars())
+    stmt = select(APIKey).where(
+        APIKey.key_prefix == None,  # noqa: E711 - SQL NULL comparison
+        APIKey.is_active == True
+    )
+    candidates.extend(db.execute(stmt).scalars())
+    for api_key in candidates:
+        if api_key.key.startswith("$2") and verify_key_hash(key, api_key.key):
+            # One-shot migration: store the HMAC so the next lookup
+            # takes the indexed fast path
+            api_key.key = hash_api_key(key)
+            db.flush()
             return api_key
     return None
 
@@ -75,6 +211,7 @@ def create_api_key(
         # Create new API key instance
         api_key = APIKey(
             key=hashed_key,
+            key_prefix=original_key[:KEY_PREFIX_LENGTH],
             name=name,
             role=role,
             user_id=user_id
@@ -99,6 +236,7 @@ def create_api_key(
         response_key = APIKey(
             id=api_key.id,
             key=original_key,  # Return the unhashed key
+            key_prefix=api_key.key_prefix,
             name=api_key.name,
             role=api_key.role,
             created_at=api_key.created_at,
@@ -121,14 +259,14 @@ def verify_api_key(db: Session, key: str) -> Optional[APIKey]:
             # Check if the user is active
             user = db.get(User, api_key.user_id)
             if user and user.status == UserStatus.ACTIVE:
-                api_key.last_used = datetime.now(UTC)
-                db.flush()
-                
-                # Audit logging
+                # Buffered; written by the periodic last_used flush
+                record_key_usage(api_key.id)
+
+                # Audit logging (details deferred until the sink accepts)
                 audit_log(
                     action=AuditAction.API_KEY_USED,
                     user_id=str(api_key.user_id),
-                    details={
+                    details=lambda: {
                         "key_name": api_key.name,
                         "key_id": api_key.id
                     }
@@ -154,7 +292,8 @@ def deactivate_api_key(
         if api_key:
             api_key.is_active = False
             db.flush()
-            
+            invalidate_key_cache()
+
             # Audit logging
             audit_log(
                 action=AuditAction.API_KEY_DEACTIVATED,
@@ -208,10 +347,47 @@ def reactivate_api_key(
 
 # app/core/security/api_key.py
 
+def _authenticate_miss(digest: bytes, raw_key: str) -> Optional[APIKey]:
+    """Full verification for a key not in the cache."""
+    # Read-mostly session: verification is lookups only, apart from the
+    # rare legacy-hash migration (which still commits)
+    with get_db_session_ro() as db:
+        key = verify_api_key(db, raw_key)
+        if key is None:
+            return None
+        return _key_cache_put(digest, key)
+
+def authenticate_api_key(raw_key: str) -> Optional[APIKey]:
+    """Verify a raw API key, opening a DB session only on a cache miss.
+
+    Cache hits return a detached copy without touching the database at
+    all; misses run the full verification and populate the cache. Usage
+    is recorded on both paths (it only touches the in-memory buffer), so
+    last_used keeps advancing per request rather than once per cache TTL.
+    API_KEY_USED audit events, by contrast, are intentionally emitted per
+    verification — roughly once per TTL per key — not per request.
+    """
+    digest = hashlib.sha256(raw_key.encode()).digest()
+    cached_key = _key_cache_get(digest)
+    if cached_key is not None:
+        record_key_usage(cached_key.id)
+        return cached_key
+    return _authenticate_miss(digest, raw_key)
+
+async def authenticate_api_key_async(raw_key: str) -> Optional[APIKey]:
+    """Async variant: cache hits resolve on the event loop, misses do
+    their DB work (and any legacy bcrypt verify) in a worker thread so
+    concurrent requests aren't stalled behind them."""
+    digest = hashlib.sha256(raw_key.encode()).digest()
+    cached_key = _key_cache_get(digest)
+    if cached_key is not None:
+        record_key_usage(cached_key.id)
+        return cached_key
+    return await asyncio.to_thread(_authenticate_miss, digest, raw_key)
+
 async def get_api_key(
     request: Request,
-    api_key: str = Security(api_key_header),
-    db: Session = Depends(get_db)
+    api_key: str = Security(api_key_header)
 ) -> Optional[APIKey]:
     """
     Dependency for validating API keys in FastAPI endpoints.
@@ -220,16 +396,16 @@ async def get_api_key(
     if not settings.API_KEY_AUTH_ENABLED:
         logger.debug("API key authentication is disabled")
         return None
-        
+
     if not api_key:
         logger.warning("API key missing in request")
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="API key required"
         )
-    
+
     try:
-        key = verify_api_key(db, api_key)
+        key = await authenticate_api_key_async(api_key)
         if not key:
             # Audit logging for failed attempts
             audit_log(
@@ -238,7 +414,7 @@ async def get_api_key(
                 details="Invalid API key attempt",
                 status="failure"
             )
-            logger.warning(f"Invalid API key attempt: {api_key[:5]}...")
+            logger.warning("Invalid API key attempt: %s...", api_key[:5])
             raise HTTPException(
                 status_code=HTTP_403_FORBIDDEN,
                 detail="Invalid or inactive API key"
@@ -246,9 +422,9 @@ async def get_api_key(
         
         # Store API key in request state
         request.state.api_key = key
-        logger.debug(f"API key validated successfully: {key.id}")
+        logger.debug("API key validated successfully: %s", key.id)
         return key
-        
+
     except HTTPException:
         raise
     except Exception as e:
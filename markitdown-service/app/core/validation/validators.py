@@ -49,7 +49,7 @@ def validate_file_extension(filename: str, allowed_extensions: Optional[set] = N
     Raises:
         FileProcessingError: If file extension is not supported
     """
-    allowed_extensions = allowed_extensions or set(settings.SUPPORTED_EXTENSIONS)
+    allowed_extensions = allowed_extensions or settings.SUPPORTED_EXTENSIONS_SET
     _, ext = os.path.splitext(filename)
     ext_lower = ext.lower()
     
@@ -130,18 +130,26 @@ def validate_file_content(
         )
         raise FileProcessingError("Empty file provided")
 
-async def validate_upload_file(request: Optional[Request] = None, file: Optional[UploadFile] = None, **kwargs) -> Tuple[str, bytes]:
+async def validate_upload_file(
+    request: Optional[Request] = None,
+    file: Optional[UploadFile] = None,
+    hasher: Optional[Any] = None,
+    **kwargs
+) -> Tuple[str, bytes]:
     """
     Validate an uploaded file, checking extension and content.
-    
+
     Args:
         request: Optional FastAPI Request object
         file: FastAPI UploadFile object
+        hasher: Optional hashlib object updated with each chunk, letting
+            callers compute a content digest in the same pass as the
+            size check
         **kwargs: Additional keyword arguments (ignored)
-    
+
     Returns:
         Tuple[str, bytes]: Validated extension and file content
-    
+
     Raises:
         FileProcessingError: If validation fails
     """
@@ -150,21 +158,42 @@ async def validate_upload_file(request: Optional[Request] = None, file: Optional
 
     # Validate extension first (quick check before reading content)
     ext = validate_file_extension(file.filename)
-    
-    # Read and validate content
-    content = await file.read()
+
+    # Stream the upload in chunks so oversized bodies are rejected before
+    # they are fully buffered in memory. The async read API hands
+    # disk-backed spool reads to the threadpool instead of blocking the
+    # event loop.
+    max_size = settings.MAX_FILE_SIZE
+    buf = bytearray()
+    await file.seek(0)
+    while chunk := await file.read(65536):
+        buf.extend(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        if len(buf) > max_size:
+            logger.warning(
+                "File size validation failed",
+                extra={
+                    "size": len(buf),
+                    "limit": max_size,
+                    "input_filename": file.filename
+                }
+            )
+            raise FileProcessingError(
+                f"File size exceeds maximum limit of {max_size} bytes"
+            )
     await file.seek(0)  # Reset file position for subsequent reads
-    
+    content = bytes(buf)
+
     metadata = {
         "filename": file.filename,
         "content_type": file.content_type,
         "extension": ext,
         "size": len(content)
     }
-    
+
     validate_file_content(content, metadata)
-    validate_file_size(content)
-    
+
     return ext, content
 
 async def validate_text_input(request: Optional[Request] = None, content: bytes = None, **kwargs) -> None:
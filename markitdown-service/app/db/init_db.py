@@ -1,3 +1,5 @@
+from pathlib import Path
+from sqlalchemy import inspect, text
 from sqlmodel import SQLModel, select
 from app.db.session import get_engine, get_db_session
 from app.core.security.api_key import create_api_key
@@ -9,11 +11,51 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentinel recording a completed init, so worker restarts and dev
+# reloads skip the DDL sweep and seed queries
+_INIT_SENTINEL = Path(settings.LOG_DIR) / ".db_initialized"
+
+def _sentinel_value() -> str:
+    return f"{settings.VERSION}:{settings.ENVIRONMENT}:{settings.DATABASE_URL}"
+
+def _run_schema_migrations(engine) -> None:
+    """Bring an existing database up to the current schema.
+
+    create_all(checkfirst=True) skips tables that already exist, so
+    columns and indexes added after a deployment's first init (the
+    docker-compose setup persists the DB volume across upgrades) have
+    to be applied here. Each step is idempotent and cheap, so this runs
+    on every startup, including the sentinel fast path.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table("api_keys"):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("api_keys")}
+    with engine.begin() as conn:
+        if "key_prefix" not in columns:
+            logger.info("Adding api_keys.key_prefix column to existing schema")
+            conn.execute(text(
+                "ALTER TABLE api_keys ADD COLUMN key_prefix VARCHAR"
+            ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_api_keys_key_prefix "
+            "ON api_keys (key_prefix)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_api_keys_active_key "
+            'ON api_keys ("key") WHERE is_active = 1'
+        ))
+        # Superseded by the partial index above; dropping it halves the
+        # index maintenance on every api_keys write
+        conn.execute(text("DROP INDEX IF EXISTS ix_api_keys_key"))
+
 def init_db(db_session) -> None:
     """Initialize the database."""
     engine = get_engine()
     logger.info("Creating database tables...")
     SQLModel.metadata.create_all(engine, checkfirst=True)
+    _run_schema_migrations(engine)
     logger.info("Database tables created successfully")
 
     # Create initial admin user and API key if enabled
@@ -95,10 +137,31 @@ def ensure_db_initialized():
     """
     Ensure database is initialized. This is a convenience function
     that can be called during application startup.
+
+    A sentinel written after the first successful init lets subsequent
+    startups (dev reloads, additional workers) take a fast path that
+    only confirms the schema is present instead of re-running the full
+    create_all + seed-check sweep.
     """
+    try:
+        if _INIT_SENTINEL.read_text() == _sentinel_value():
+            # Trust the sentinel only if the schema actually exists —
+            # the database file may have been removed since it was written
+            if inspect(get_engine()).has_table("api_keys"):
+                _run_schema_migrations(get_engine())
+                logger.info("Database already initialized; skipping full init")
+                return
+    except OSError:
+        pass  # no sentinel yet
+
     try:
         with get_db_session() as db:
             init_db(db)
+        try:
+            _INIT_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+            _INIT_SENTINEL.write_text(_sentinel_value())
+        except OSError:
+            logger.warning("Could not write DB init sentinel", exc_info=True)
     except Exception as e:
         logger.error("Failed to initialize database")
         logger.exception(e)
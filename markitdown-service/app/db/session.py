@@ -46,10 +46,35 @@ def get_db_session():
         logger.debug("Closing database session")
         session.close()
 
+@contextmanager
+def get_db_session_ro():
+    """
+    Context manager for read-mostly database sessions.
+
+    Skips autoflush (no pending writes to reconcile before queries) and
+    keeps instances usable after commit (expire_on_commit=False), which
+    makes it cheaper than get_db_session for lookup paths such as API
+    key verification. Writes still commit on success.
+    """
+    engine = get_engine()
+    session = Session(engine, autoflush=False, expire_on_commit=False)
+    try:
+        yield session
+        session.commit()
+    except HTTPException:
+        session.rollback()
+        raise
+    except Exception:
+        logger.exception("Database session error, rolling back transaction")
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 def get_db():
     """
     FastAPI dependency for database sessions.
-    
+
     Usage:
         @router.get("/")
         async def endpoint(db: Session = Depends(get_db)):
@@ -58,4 +83,4 @@ def get_db():
     with get_db_session() as session:
         yield session
 
-__all__ = ["get_engine", "get_db", "get_db_session"]
+__all__ = ["get_engine", "get_db", "get_db_session", "get_db_session_ro"]
@@ -1,19 +1,21 @@
+import asyncio
 import time
 import logging
 import logging.config
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from app.core.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy import text
 import os
 from pathlib import Path
 from app.api.v1.endpoints import conversion, admin
-from app.core.security.api_key import get_api_key
+from app.core.security.api_key import get_api_key, flush_last_used, flush_last_used_loop
 from app.db.init_db import ensure_db_initialized
 from app.db.session import get_db, get_db_session
-from app.core.config.settings import settings
+from app.core.config.settings import settings, PLACEHOLDER_SECRET_KEYS
 from app.core.logging.config import get_web_logging_config
 from app.core.audit import audit_log, AuditAction
 from app.core.logging.management import LogManager
@@ -40,7 +42,7 @@ security_logger = logging.getLogger("app.core.security")
 @handle_api_operation("global_exception_handler")
 async def global_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception occurred", extra={"path": request.url.path})
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "An unexpected error occurred. Please try again later."}
     )
@@ -49,7 +51,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 @handle_api_operation("validation_exception_handler")
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logger.warning("Request validation failed", extra={"errors": exc.errors(), "body": exc.body})
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={"detail": "Invalid request parameters", "errors": exc.errors()}
     )
@@ -61,6 +63,7 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
+    last_used_flusher = None
     try:
         logger.info("Starting application initialization...")
         
@@ -69,12 +72,26 @@ async def lifespan(app: FastAPI):
         log_dir.mkdir(parents=True, exist_ok=True)
         
         # Log detailed configuration in debug mode
-        logger.debug("Application configuration:")
-        logger.debug(f"Environment: {settings.ENVIRONMENT}")
-        logger.debug(f"Log Level: {settings.LOG_LEVEL}")
-        logger.debug(f"API Key Auth: {settings.API_KEY_AUTH_ENABLED}")
-        logger.debug(f"Log Directory: {settings.LOG_DIR}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Application configuration:")
+            logger.debug("Environment: %s", settings.ENVIRONMENT)
+            logger.debug("Log Level: %s", settings.LOG_LEVEL)
+            logger.debug("API Key Auth: %s", settings.API_KEY_AUTH_ENABLED)
+            logger.debug("Log Directory: %s", settings.LOG_DIR)
         
+        # SECRET_KEY signs the HMAC under which API keys are stored, so a
+        # placeholder value leaves every stored credential forgeable
+        if settings.SECRET_KEY in PLACEHOLDER_SECRET_KEYS:
+            if settings.ENVIRONMENT == "production":
+                raise RuntimeError(
+                    "SECRET_KEY is set to a placeholder value; configure a "
+                    "real secret before running in production"
+                )
+            security_logger.warning(
+                "SECRET_KEY is a placeholder value; set a real secret "
+                "before deploying to production"
+            )
+
         # Initialize database
         logger.info("Initializing database...")
         ensure_db_initialized()
@@ -88,6 +105,9 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning(f"Failed to check logrotate configuration: {e}")
         
+        # Start background flush of buffered last_used timestamps
+        last_used_flusher = asyncio.create_task(flush_last_used_loop())
+
         # Log startup status
         logger.info(f"Application started successfully in {settings.ENVIRONMENT} mode")
 
@@ -120,6 +140,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Initiating application shutdown...")
     try:
+        # Stop the flush task and write any buffered last_used updates
+        if last_used_flusher is not None:
+            last_used_flusher.cancel()
+        flush_last_used()
+
+        # Close pooled HTTP connections
+        await conversion.HTTP_CLIENT.aclose()
+
         # Ensure all logs are flushed
         for handler in logging.getLogger().handlers:
             handler.flush()
@@ -147,12 +175,16 @@ app = FastAPI(
     docs_url=settings.DOCS_URL,
     redoc_url=settings.REDOC_URL,
     openapi_url=settings.OPENAPI_URL,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add rate limiting
 app.add_middleware(RateLimitMiddleware)
 
+# Compress large responses; markdown is highly redundant and compresses well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -181,11 +213,34 @@ app.include_router(
     dependencies=[Depends(get_api_key)] if settings.API_KEY_AUTH_ENABLED else None
 )
 
+# Health probes fire many times a minute from load balancers; serve the
+# healthy payload from a short-lived cache so only one DB probe (and one
+# audit entry) runs per window. Failures are never cached, and the cache
+# is keyed on the toggleable settings reflected in the payload so a
+# config change is never reported stale.
+_HEALTH_CACHE_TTL = 2.0  # seconds
+_health_cache = None  # (expires_at, settings_key, payload)
+
+def _health_settings_key():
+    """Snapshot of the runtime-toggleable settings shown in the payload."""
+    return (
+        settings.API_KEY_AUTH_ENABLED,
+        settings.RATE_LIMITING_ENABLED,
+        settings.RATE_LIMIT_DEFAULT_RATE
+    )
+
 # Health check endpoint (no API key required)
 @app.get("/health", tags=["system"])
 @handle_api_operation("health_check")
 async def health_check():
     """Check the health of the service."""
+    global _health_cache
+    if (
+        _health_cache
+        and time.monotonic() < _health_cache[0]
+        and _health_cache[1] == _health_settings_key()
+    ):
+        return _health_cache[2]
     try:
         # Verify database connection using context manager
         with get_db_session() as db:
@@ -240,12 +295,17 @@ async def health_check():
         
         # If there are any warnings, reflect in response code
         if log_status == "warning":
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content=health_status,
                 headers={"X-Health-Warning": "Log system issues detected"}
             )
-        
+
+        _health_cache = (
+            time.monotonic() + _HEALTH_CACHE_TTL,
+            _health_settings_key(),
+            health_status
+        )
         return health_status
     except Exception as e:
         error_details = {
@@ -267,7 +327,7 @@ async def health_check():
             status="failure"
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content=error_details
         )
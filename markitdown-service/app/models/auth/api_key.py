@@ -1,5 +1,6 @@
 from datetime import datetime, UTC
 from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 from enum import Enum
 
@@ -12,9 +13,20 @@ class Role(str, Enum):
 
 class APIKey(SQLModel, table=True):
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Sole index on key, partial to match the auth lookup
+        # (WHERE key = :k AND is_active); deactivated keys drop out so
+        # the index stays minimal
+        Index(
+            "ix_api_keys_active_key",
+            "key",
+            sqlite_where=text("is_active = 1")
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    key: str = Field(index=True)
+    key: str
+    key_prefix: Optional[str] = Field(default=None, index=True)
     name: str
     role: Role
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -8,7 +8,7 @@ from sqlmodel import SQLModel, delete, Session, select
 from app.main import app
 from app.core.config import settings
 from app.db.session import get_db_session, get_engine
-from app.core.security.api_key import create_api_key
+from app.core.security.api_key import create_api_key, invalidate_key_cache
 from app.core.security.user import create_user
 from app.core.rate_limiting.limiter import limiter
 from app.models.auth.api_key import Role, APIKey
@@ -124,3 +124,4 @@ def auth_client(db_session):
     settings.API_KEY_AUTH_ENABLED = original_auth_setting
     settings.RATE_LIMITING_ENABLED = original_rate_limiting
     limiter.reset()
+    invalidate_key_cache()
@@ -40,6 +40,46 @@ class TestNoAuthAPI:
         assert response.text  # Should contain markdown content
         assert "# " in response.text  # Basic check for markdown headers
 
+    def test_convert_files_no_auth(self) -> None:
+        """Test batch file conversion without authentication"""
+        assert TEST_FILE_PATH.exists(), f"Test file not found: {TEST_FILE_PATH}"
+
+        with open(TEST_FILE_PATH, "rb") as f:
+            content = f.read()
+
+        files = [
+            ("files", ("TestDoc.docx", content, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")),
+            ("files", ("test.html", b"<h1>Batch Header</h1>", "text/html")),
+            ("files", ("bad.invalid", b"nope", "application/octet-stream")),
+        ]
+        response = self.client.post("/api/v1/convert/files", files=files)
+
+        assert response.status_code == 200
+        results = response.json()
+        assert len(results) == 3
+
+        assert results[0]["filename"] == "TestDoc.docx"
+        assert results[0]["status"] == "success"
+        assert "# " in results[0]["markdown"]
+
+        assert results[1]["status"] == "success"
+        assert "# Batch Header" in results[1]["markdown"]
+
+        # Unsupported extension fails per file, not the whole batch
+        assert results[2]["status"] == "error"
+        assert "Unsupported file type" in results[2]["detail"]
+
+    def test_convert_files_batch_too_large(self) -> None:
+        """Test batch conversion rejects batches over the file-count cap"""
+        files = [
+            ("files", (f"doc{i}.html", b"<h1>x</h1>", "text/html"))
+            for i in range(settings.MAX_BATCH_FILES + 1)
+        ]
+        response = self.client.post("/api/v1/convert/files", files=files)
+
+        assert response.status_code == 400
+        assert "exceeds maximum" in response.json()["detail"]
+
     def test_convert_text_no_auth(self) -> None:
         """Test text conversion without authentication"""
         test_html = "<h1>Test Header</h1><p>Test paragraph</p>"
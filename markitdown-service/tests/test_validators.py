@@ -1,4 +1,5 @@
 import pytest
+from io import BytesIO
 from app.core.validation.validators import (
     validate_file_size,
     validate_file_extension,
@@ -104,14 +105,14 @@ class MockUploadFile:
     def __init__(self, filename: str, content_type: str, content: bytes):
         self.filename = filename
         self.content_type = content_type
+        self.file = BytesIO(content)
         self._content = content
-        self._position = 0
 
-    async def read(self) -> bytes:
-        return self._content
+    async def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
 
     async def seek(self, position: int) -> None:
-        self._position = position
+        self.file.seek(position)
 
 @pytest.mark.asyncio
 async def test_validate_upload_file_success():